@@ -0,0 +1,10 @@
+"""
+Shared implementation of the Gemini REST API alert scripts.
+
+"apiAlerts.py" (candles endpoint) and "apiAlerts-ticker.py" (ticker endpoint)
+only provide a fetcher and a parser, and hand them to run().
+"""
+
+from gemini_alerts._core import run
+
+__all__ = ["run"]
@@ -0,0 +1,422 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+import click
+import logging
+from datetime import datetime
+from datetime import timezone as tz
+from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfoNotFoundError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# reusable stdlib encoder, used when orjson is not available
+_ENCODER = json.JSONEncoder(indent=2)
+
+GEMINI_API_URL = "https://api.sandbox.gemini.com/"
+# (connect, read) timeouts in seconds for Gemini REST API requests
+GEMINI_API_TIMEOUT = (3.05, 10)
+
+# click option choices
+_FORMATS = ("json", "yaml", "prometheus")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+logger = logging.getLogger(__name__)
+
+# shared HTTP session, keeps TLS connections alive between requests
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# memoized timezone lookup, avoids re-reading tzdata for repeated calls
+_zi = lru_cache(maxsize=8)(ZoneInfo)
+
+# local cache for API responses
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".gemini_alerts_cache")
+
+
+class TZType(click.ParamType):
+    """
+    click parameter type which validates a timezone name and converts it to ZoneInfo
+    """
+
+    name = "timezone"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, ZoneInfo):
+            return value
+        try:
+            return _zi(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            self.fail(f"{value!r} is not a valid timezone", param, ctx)
+
+
+def run(fetcher, parser, cache_ttl):
+    """
+    Configure logging and run the alert command line interface.
+
+    Args:
+        fetcher:   function(symbol, cache=None), returns API response for symbol or None
+        parser:    function(prices, ts_now), returns output data (dict) including "stddev"
+        cache_ttl: default max age in seconds of cached API responses
+
+    Returns:
+        None
+    """
+    logging.basicConfig(format="%(asctime)s %(levelname)s - AlertingTool - %(message)s")
+    make_command(fetcher, parser, cache_ttl)()
+
+
+def make_command(fetcher, parser, cache_ttl):
+    """
+    Build the alert click command for given fetcher and parser, see run()
+
+    Returns:
+        click.Command
+    """
+
+    @click.command()
+    @click.option(
+        "-c",
+        "--chain",
+        required=True,
+        multiple=True,
+        help='Filter prices by specific chain, may be given multiple times (example: "BTCUSD", "ETHUSD", "BTCETH", ...)',
+    )
+    @click.option(
+        "-n",
+        "--dry-run",
+        "dry_run",
+        flag_value=True,
+        default=False,
+        help="Dry-run will prevent sending alert event",
+    )
+    @click.option(
+        "-t",
+        "--threshold",
+        type=click.FLOAT,
+        default=1.0,
+        help="Override default threshold for calculated standard deviation to trigger alert (Default: 1.0)",
+    )
+    @click.option(
+        "-f",
+        "--output-format",
+        type=click.Choice(_FORMATS),
+        default="json",
+        help="Select output format (Default: json)",
+    )
+    @click.option(
+        "-z",
+        "--timezone",
+        type=TZType(),
+        default="UTC",
+        help="Define timezone for output data (Default: UTC)",
+    )
+    @click.option(
+        "--log-level",
+        type=click.Choice(_LOG_LEVELS),
+        default="INFO",
+        help="Log level to output (Default: INFO)",
+    )
+    @click.option(
+        "--no-cache",
+        "no_cache",
+        flag_value=True,
+        default=False,
+        help="Always request fresh data from Gemini API instead of using cached responses",
+    )
+    @click.option(
+        "--cache-ttl",
+        type=click.IntRange(min=0),
+        default=cache_ttl,
+        help=f"Override max age in seconds of cached API responses (Default: {cache_ttl})",
+    )
+    @click.option(
+        "-w",
+        "--watch",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Keep running and repeat every INTERVAL seconds, without response cache (Default: run once)",
+        metavar="INTERVAL",
+    )
+    def main(
+        chain,
+        dry_run,
+        threshold,
+        output_format,
+        timezone,
+        log_level,
+        no_cache,
+        cache_ttl,
+        watch,
+    ):
+        """
+        Gemini REST API alert script for calculated standard deviation from hourly prices for past 24 hours.
+
+        Trigger an alert event for
+
+        Returns:
+            Calculated standard deviation (value) for each given symbol, as provided by "--chain"
+        """
+
+        logging.getLogger(__package__).setLevel(log_level.upper())
+
+        """
+        initialize some basic values we need
+        """
+        format = output_format.lower()
+        # watch mode always requests fresh data, cached responses would be
+        # re-emitted with a new timestamp for up to the cache ttl
+        cache = None if no_cache or watch else FileCache(cache_ttl)
+        symbols = list(chain)
+        fetch_prices = partial(fetcher, cache=cache)
+
+        if dry_run:
+            logger.info("DRY_RUN - Alert events will not be triggered")
+
+        def run_once(executor):
+            ts_now_utc = datetime.now(tz.utc)
+            ts_now = ts_now_utc.astimezone(tz=timezone)
+            ts_now_iso8601 = ts_now.isoformat(timespec="seconds")
+
+            """
+            get list of prices for each hour for past 24hrs, for each chain concurrently
+            """
+            results = list(executor.map(fetch_prices, symbols))
+
+            for symbol, prices in zip(symbols, results):
+                output_data = {}
+                std_dev = float()
+
+                # one failing chain must not prevent output for the others
+                try:
+                    if prices:
+                        """
+                        calculate output data, including standard deviation of prices changes
+                        """
+                        output_data = parser(prices, ts_now)
+                        std_dev = output_data.get("stddev", 0.0)
+
+                        if not output_data:
+                            logger.warning(
+                                "No price data within past 24 hours for %s", symbol
+                            )
+                        elif std_dev >= threshold:
+                            logger.info(
+                                "Calculated standard deviation (%s) >= threshold (%.1f). Alert event would have been triggered.",
+                                std_dev,
+                                threshold,
+                            )
+                        else:
+                            logger.info(
+                                "Calculated standard deviation (%s) <= threshold (%.1f). Alert event would not have been triggered.",
+                                std_dev,
+                                threshold,
+                            )
+                except Exception as e:
+                    logger.exception("Unable to calculate output data for %s", symbol)
+                    output_data = {"error": f"{e}"}
+                    std_dev = float()
+
+                try:
+                    if dry_run or std_dev >= threshold:
+                        write_output(
+                            ts_now_iso8601, symbol, output_data, log_level, format
+                        )
+                except Exception:
+                    logger.exception("Unable to write output for %s", symbol)
+
+        """
+        run once, or keep process resident and repeat every "--watch" seconds
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+                if watch is None:
+                    run_once(executor)
+                    return None
+
+                while True:
+                    started = time.monotonic()
+                    # failures are isolated per chain inside run_once(), this is
+                    # a last-resort guard so the resident process never exits
+                    try:
+                        run_once(executor)
+                    except Exception:
+                        logger.exception(
+                            "Alert cycle failed, retrying in %s seconds", watch
+                        )
+                    time.sleep(max(0.0, watch - (time.monotonic() - started)))
+
+        except KeyboardInterrupt:
+            logger.info("Interrupted, exiting")
+
+        return None
+
+    return main
+
+
+def get_json(endpoint, symbol, timeframe="", cache=None):
+    """
+    Retrieves a Gemini REST API v2 response for symbol, serving it from cache when fresh.
+
+    Args:
+        endpoint:  API endpoint name (string).  example: "ticker", "candles"
+        symbol:    which blockchain to retrieve data for by symbol (string).  example: "BTCUSD",
+        timeframe: optional time range path segment (string).  example: "1hr"
+        cache:     optional FileCache to serve recent responses from
+
+    Returns:
+        parsed API response, or None if request failed
+    """
+    if cache:
+        prices = cache.get(endpoint, symbol, timeframe)
+        if prices is not None:
+            logger.info("Using cached %s data for symbol %s", endpoint, symbol)
+            return prices
+
+    logger.info("Requesting %s data for symbol %s", endpoint, symbol)
+    try:
+        url = GEMINI_API_URL + "v2/" + endpoint + "/" + symbol.lower()
+        if timeframe:
+            url += "/" + timeframe
+        response = get_session().get(url, timeout=GEMINI_API_TIMEOUT)
+        response.raise_for_status()  # Raise an exception for bad status codes
+        prices = json_loads(response.content)
+        if cache:
+            cache.set(prices, endpoint, symbol, timeframe)
+
+        # DEBUG, only serialize response when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json_dumps(prices))
+
+        return prices
+
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error("Unable to fetch data from Gemini API: %s", e)
+        return None
+
+
+class FileCache:
+    """
+    File based cache for Gemini REST API responses.
+    Entries are stored as "{cache_dir}/{endpoint}/{key}.json" in a {"ts": epoch, "body": ...}
+    envelope, and expire "ttl" seconds after "ts".
+    """
+
+    def __init__(self, ttl, cache_dir=CACHE_DIR):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+
+    def _path(self, endpoint, symbol, timeframe=""):
+        key = hashlib.md5(
+            (endpoint + symbol.lower() + timeframe).encode(), usedforsecurity=False
+        ).hexdigest()
+        return os.path.join(self.cache_dir, endpoint, key + ".json")
+
+    def get(self, endpoint, symbol, timeframe=""):
+        """
+        Returns cached response body, or None if missing or older than ttl
+        """
+        path = self._path(endpoint, symbol, timeframe)
+        try:
+            with open(path, "rb") as f:
+                entry = json_loads(f.read())
+            if time.time() - entry["ts"] > self.ttl:
+                return None
+            return entry["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, body, endpoint, symbol, timeframe=""):
+        """
+        Atomically writes response body to cache, failures are logged and ignored
+        """
+        path = self._path(endpoint, symbol, timeframe)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"ts": time.time(), "body": body}, f)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Unable to write cache file %s: %s", path, e)
+            # don't leave partial temp files behind, ie. on a full disk
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+def json_loads(data):
+    """
+    Parse JSON from str or bytes, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """
+    Serialize obj to an indented JSON string, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return _ENCODER.encode(obj)
+
+
+def get_session():
+    """
+    Returns the shared requests session used for all Gemini REST API calls.
+    Additional adapters (ie. urllib3 Retry for 429/5xx backoff) can be mounted on it.
+
+    Returns:
+        requests.Session
+    """
+    return _SESSION
+
+
+def write_output(timestamp_now, chain, output_data, log_level, format):
+    """
+    write output data to stdout in provided format
+
+    Args:
+        output:  data object of output data
+        format:  data output format (must be one of: json, yaml, prometheus)
+
+    Returns:
+        None
+    """
+    if format in ("yaml", "prometheus"):
+        # TODO: output-format="yaml", output-format="prometheus"
+        print(f'NOT IMPLEMENTED.  Please use "--output-format=json".')
+        return None
+
+    level = log_level.upper()
+    trading_pair = chain.upper()
+    output = {
+        "timestamp": timestamp_now,
+        "log_level": level,
+        "trading_pair": trading_pair,
+        "deviation": output_data.get("stddev", 0.0) > 0,
+        "data": output_data,
+        # { "error": None }
+        # { "last_price": float(), "average_price": string(), "stddev": float(), "change": float() }
+    }
+
+    sys.stdout.write(json_dumps(output))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+    return None
@@ -0,0 +1,74 @@
+"""
+Price statistics shared by the alert scripts.
+
+numpy and numba are optional: numpy is used when available, otherwise a pure
+python Welford loop. numba is only imported for inputs of at least
+NUMBA_MIN_SIZE values (ie. multi-day or 1m lookbacks), since importing it and
+loading the cached kernel costs ~0.3s per process, far more than numpy needs
+for 24 hourly prices.
+"""
+
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# minimum number of values for which the numba compiled kernel is used
+NUMBA_MIN_SIZE = 1000
+
+
+def mean_stdev(data):
+    """
+    Calculates the mean and sample standard deviation of numerical values.
+
+    Args:
+        data: A sequence (list or numpy array) of numerical values.
+
+    Returns:
+        tuple of (mean, standard deviation) as floats.
+    """
+    if np is None:
+        return _welford(data)
+    arr = np.asarray(data, dtype=np.float64)
+    if arr.size < 2:
+        # sample stddev is undefined, match the Welford result of 0.0
+        return _welford(arr.tolist())
+    if arr.size >= NUMBA_MIN_SIZE:
+        kernel = _numba_welford()
+        if kernel is not None:
+            m, s = kernel(arr)
+            return float(m), float(s)
+    return float(arr.mean()), float(arr.std(ddof=1))
+
+
+def _welford(data):
+    """
+    Welford's online algorithm, computes mean and sample variance in one pass over data.
+    """
+    n = 0
+    m = 0.0
+    m2 = 0.0
+    for x in data:
+        n += 1
+        d = x - m
+        m += d / n
+        m2 += d * (x - m)
+    if n < 2:
+        return m, 0.0
+    return m, (m2 / (n - 1)) ** 0.5
+
+
+
+@lru_cache(maxsize=1)
+def _numba_welford():
+    """
+    Lazily compile Welford's algorithm with numba for float64 arrays, or None if numba is not installed.
+    cache=True keeps compiled code between runs.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_welford)
@@ -0,0 +1,128 @@
+import logging
+from datetime import datetime
+from datetime import timezone as tz
+from datetime import timedelta
+from gemini_alerts._core import get_json
+from gemini_alerts._stats import mean_stdev
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# default time-to-live in seconds of cached candles responses
+CANDLE_CACHE_TTL = 3300
+
+logger = logging.getLogger(__name__)
+
+
+def get_candle_by_symbol(symbol, timeframe, cache=None):
+    """
+    Retrieves price candles for given symbol and time range.
+    API Documentation: [Candles](https://docs.gemini.com/rest-api/?python#candles)
+    API Endpoint: '/v2/candles/:symbol/:time_frame'
+    Endpoint Description: This endpoint retrieves time-intervaled data for the provided symbol.
+
+    Args:
+        symbol: which blockchain to retrieve data for by symbol (string).  example: "BTCUSD",
+        timeframe: candle time range (string).  example: "1hr",
+        cache:  optional FileCache to serve recent responses from
+
+    Returns:
+        candle price data for a given symbol, newest first
+        > API Response (array of arrays):
+        >     FIELD       TYPE                DESCRIPTION
+        >     time        long (millis)       Time in milliseconds
+        >     open        decimal             Open price
+        >     high        decimal             High price
+        >     low         decimal             Low price
+        >     close       decimal             Close price
+        >     volume      decimal             Volume
+    """
+    return get_json("candles", symbol, timeframe, cache)
+
+
+def parse_candles(prices, ts_now):
+    """
+    Calculate output data from 1hr price candles for past 24hrs
+
+    Args:
+        prices: candles as returned by get_candle_by_symbol
+        ts_now: current time (datetime)
+
+    Returns:
+        output data (dict) of last_price, average_price, stddev and change,
+        or empty dict if no candle is within past 24hrs
+    """
+    """
+    collect 1hr price candles data for past 24hrs
+    """
+    # use 25 hours timedelta to include the full hour from 24hrs ago
+    cutoff_ms = int((ts_now - timedelta(hours=25)).timestamp() * 1000)
+    timestamps, prices_hourly = candle_closes(prices, cutoff_ms)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        price_data = [
+            {
+                "timestamp": datetime.fromtimestamp(int(t) / 1000, tz=tz.utc).isoformat(
+                    timespec="auto"
+                ),
+                "price": float(p),
+            }
+            for t, p in zip(timestamps, prices_hourly)
+        ]
+        logger.debug("prices for each hour over last 24 hours: %s", price_data)
+
+    if len(prices_hourly) == 0:
+        return {}
+
+    """
+    calculate most recent price
+    """
+    last_price = float(prices_hourly[0])
+
+    """
+    calculate average price and standard deviation of prices changes
+    """
+    average_price, std_dev = mean_stdev(prices_hourly)
+
+    """
+    calculate change in price over time range
+    """
+    price_change = float(prices_hourly[0] - prices_hourly[-1])
+
+    return {
+        "last_price": last_price,
+        "average_price": average_price,
+        "stddev": std_dev,
+        "change": price_change,
+    }
+
+
+def candle_closes(prices, cutoff_ms):
+    """
+    Split candles into parallel timestamp and close price arrays, keeping candles newer than cutoff.
+
+    Args:
+        prices:    candles as returned by get_candle_by_symbol (newest first)
+        cutoff_ms: oldest candle timestamp to keep, in epoch milliseconds
+
+    Returns:
+        tuple of (timestamps, close prices), as numpy arrays when numpy is available, otherwise lists
+    """
+    if np is not None:
+        raw = np.asarray(prices, dtype=np.float64)
+        timestamps = raw[:, 0].astype(np.int64)
+        closes = raw[:, 4]
+        mask = timestamps >= cutoff_ms
+        return timestamps[mask], closes[mask]
+
+    timestamps = []
+    closes = []
+    for x in prices:
+        # candles are ordered newest first, stop at the first one past cutoff
+        if x[0] < cutoff_ms:
+            break
+        timestamps.append(x[0])
+        closes.append(float(x[4]))
+    return timestamps, closes
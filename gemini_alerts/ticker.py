@@ -0,0 +1,98 @@
+import logging
+from datetime import timedelta
+from gemini_alerts._core import get_json
+from gemini_alerts._stats import mean_stdev
+
+# default time-to-live in seconds of cached ticker responses
+TICKER_CACHE_TTL = 300
+
+logger = logging.getLogger(__name__)
+
+
+def get_ticker_by_symbol(symbol, cache=None):
+    """
+    Retrieves ticker hourly prices for past 24 hours.
+    API Documentation: [Ticker V2](https://docs.gemini.com/rest-api/?python#ticker-v2)
+    API Endpoint: '/v2/ticker/:symbol'
+    Endpoint Description: This endpoint retrieves information about recent trading activity for the provided symbol.
+
+    Args:
+        symbol: which blockchain to retrieve data for by symbol (string).  example: "BTCUSD",
+        cache:  optional FileCache to serve recent responses from
+
+    Returns:
+        ticker price data for a given symbol
+        > API Response (obj):
+        >     FIELD       TYPE                DESCRIPTION
+        >     symbol      string              BTCUSD etc.
+        >     open        decimal             Open price from 24 hours ago
+        >     high        decimal             High price from 24 hours ago
+        >     low         decimal             Low price from 24 hours ago
+        >     close       decimal             Close price (most recent trade)
+        >     changes     array of decimals   Hourly prices descending for past 24 hours
+        >     --          decimal             Close price for each hour
+        >     bid         decimal             Current best bid
+        >     ask         decimal             Current best offer
+    """
+    return get_json("ticker", symbol, cache=cache)
+
+
+def parse_ticker(prices, ts_now):
+    """
+    Calculate output data from ticker hourly prices for past 24hrs
+
+    Args:
+        prices: ticker data as returned by get_ticker_by_symbol
+        ts_now: current time (datetime), in timezone used for output data
+
+    Returns:
+        output data (dict) of last_price, average_price, stddev and change,
+        or empty dict if there are no hourly prices
+    """
+    """
+    log opening price from 24hrs ago
+    """
+    ts_24hrs_ago = ts_now - timedelta(hours=24)
+    logger.info(
+        "%s opened at %s with price %s",
+        prices["symbol"],
+        ts_24hrs_ago.strftime("%Y/%m/%d %H:%M"),
+        prices["open"],
+    )
+
+    """
+    map prices[changes] values to list of floats
+    """
+    prices_hourly = [float(x) for x in prices["changes"]]
+
+    logger.debug("prices for each hour over last 24 hours: %s", prices_hourly)
+
+    if not prices_hourly:
+        return {}
+
+    """
+    calculate most recent price
+    """
+    last_price = float(prices["close"])
+
+    """
+    calculate average price
+    """
+    average_price = (float(prices["high"]) + float(prices["low"])) * 0.5
+
+    """
+    calculate change in price over time range
+    """
+    price_change = prices_hourly[0] - prices_hourly[-1]
+
+    """
+    calculate standard deviation of prices changes
+    """
+    _, std_dev = mean_stdev(prices_hourly)
+
+    return {
+        "last_price": last_price,
+        "average_price": average_price,
+        "stddev": std_dev,
+        "change": price_change,
+    }